@@ -26,13 +26,13 @@ def convert(
 
     with readable(input_file) as f:
         lines = f.readlines()
-    jinja2 = "".join(_replace(line) for line in lines)
     if dry_run:
+        jinja2 = "".join(_replace(line) for line in lines)
         for line in jinja2.removesuffix("\n").split("\n"):
             log.info(line)
     else:
         with writable(output_file) as f:
-            f.write(jinja2)
+            f.writelines(_replace(line) for line in lines)
 
 
 def _replace(atline: str) -> str:
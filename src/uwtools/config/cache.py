@@ -0,0 +1,123 @@
+"""
+Caching of parsed config files.
+"""
+
+import json
+import os
+from copy import deepcopy
+from functools import lru_cache
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Any
+
+from uwtools.config.formats.yaml import YAMLConfig
+from uwtools.config.support import INCLUDE_TAG
+from uwtools.logging import log
+
+
+def hit_rate() -> float:
+    """
+    Returns the fraction of load_yaml() calls served from the cache.
+    """
+    info = _parse_yaml.cache_info()  # pylint: disable=no-value-for-parameter
+    calls = info.hits + info.misses
+    return info.hits / calls if calls else 0.0
+
+
+def load_yaml(path: Path) -> dict:
+    """
+    Returns the parsed content of the specified YAML file.
+
+    Repeated loads of a file whose size and modification time are unchanged skip the parser and
+    return a copy of the previously parsed content.
+
+    Files using the !INCLUDE tag merge in content from other files, so their parse results cannot
+    be keyed on the top-level file's metadata alone: They bypass the cache and are re-parsed on
+    every load.
+
+    :param path: Path to the YAML file to load.
+    """
+    path = Path(path)
+    info = path.stat()
+    if _has_includes(path):
+        return YAMLConfig(config=path).data
+    return deepcopy(_parse_yaml(path, info.st_mtime_ns, info.st_size))
+
+
+def _has_includes(path: Path) -> bool:
+    """
+    Does the YAML file at the given path use the !INCLUDE tag?
+
+    A false positive (e.g. the tag in a comment) is harmless, costing only cacheability.
+
+    :param path: Path to the YAML file to check.
+    """
+    return INCLUDE_TAG in path.read_text(encoding="utf-8")
+
+
+def _json_safe(data: Any) -> bool:
+    """
+    Will the given value survive a JSON round trip unaltered?
+
+    :param data: The value to check.
+    """
+    if isinstance(data, dict):
+        return all(isinstance(k, str) and _json_safe(v) for k, v in data.items())
+    if isinstance(data, list):
+        return all(_json_safe(v) for v in data)
+    return data is None or isinstance(data, (str, int, float, bool))
+
+
+@lru_cache(maxsize=128)
+def _parse_yaml(path: Path, _mtime_ns: int, _size: int) -> dict:
+    """
+    Parses and returns the content of the specified YAML file.
+
+    A JSON sidecar file alongside the YAML file provides a cross-process cache: When a sidecar at
+    least as new as the YAML file exists, it is loaded via the much faster JSON parser; otherwise,
+    the YAML file is parsed and a sidecar is written for future loads.
+
+    :param path: Path to the YAML file to parse.
+    :param _mtime_ns: Modification time of the file, keying the cache entry.
+    :param _size: Size of the file, keying the cache entry.
+    """
+    sidecar = _sidecar(path)
+    if sidecar.is_file() and sidecar.stat().st_mtime_ns >= _mtime_ns:
+        try:
+            with open(sidecar, "r", encoding="utf-8") as f:
+                data: dict = json.load(f)
+                return data
+        except json.JSONDecodeError:
+            log.debug("Ignoring unparseable sidecar %s", sidecar)
+    data = YAMLConfig(config=path).data
+    _write_sidecar(sidecar, data)
+    return data
+
+
+def _sidecar(path: Path) -> Path:
+    """
+    Returns the path to the JSON sidecar for the specified YAML file.
+
+    :param path: Path to the YAML file.
+    """
+    return Path("%s.json" % path)
+
+
+def _write_sidecar(path: Path, data: dict) -> None:
+    """
+    Atomically writes a JSON sidecar with the given parsed-YAML content.
+
+    The sidecar is skipped when the content would not survive a JSON round trip (e.g. due to tagged
+    values or non-string keys) or when the filesystem refuses the write.
+
+    :param path: Path to the sidecar file to write.
+    :param data: Parsed content of the corresponding YAML file.
+    """
+    if not _json_safe(data):
+        return
+    try:
+        with NamedTemporaryFile("w", delete=False, dir=path.parent, suffix=".tmp") as f:
+            json.dump(data, f)
+        os.replace(f.name, path)
+    except OSError:
+        log.debug("Could not write sidecar %s", path)
@@ -60,7 +60,7 @@ class FieldTableConfig(YAMLConfig):
                     lines.append(f'{" ":11}"{key}", "{value}"')
             lines[-1] += " /"
         with writable(path) as f:
-            print("\n".join(lines), file=f)
+            f.writelines(f"{line}\n" for line in lines)
 
     @staticmethod
     def get_depth_threshold() -> Optional[int]:
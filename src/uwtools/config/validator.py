@@ -3,13 +3,10 @@ Support for validating a config using JSON Schema.
 """
 
 import json
+from functools import cache
 from pathlib import Path
 from typing import List, Optional, Union
 
-import jsonschema
-from referencing import Registry, Resource
-from referencing.jsonschema import DRAFT202012
-
 from uwtools.config.formats.yaml import YAMLConfig
 from uwtools.exceptions import UWConfigError
 from uwtools.logging import log
@@ -46,8 +43,7 @@ def validate_yaml(
     :param config: The config to validate.
     :return: Did the YAML file conform to the schema?
     """
-    with open(schema_file, "r", encoding="utf-8") as f:
-        schema = json.load(f)
+    schema = _schema(schema_file)
     cfgobj = _prep_config(config)
     errors = _validation_errors(cfgobj.data, schema)
     log_method = log.error if errors else log.info
@@ -74,6 +70,33 @@ def _prep_config(config: Union[dict, YAMLConfig, Optional[Path]]) -> YAMLConfig:
     return cfgobj
 
 
+def _schema(schema_file: Path) -> dict:
+    """
+    Returns the JSON Schema loaded from the given file.
+
+    Repeated loads of a file whose size and modification time are unchanged skip the read and
+    return the previously parsed schema.
+
+    :param schema_file: The JSON Schema file to load.
+    """
+    info = schema_file.stat()
+    return _parse_schema(schema_file, info.st_mtime_ns, info.st_size)
+
+
+@cache
+def _parse_schema(schema_file: Path, _mtime_ns: int, _size: int) -> dict:
+    """
+    Parses and returns the JSON Schema in the given file.
+
+    :param schema_file: The JSON Schema file to parse.
+    :param _mtime_ns: Modification time of the file, keying the cache entry.
+    :param _size: Size of the file, keying the cache entry.
+    """
+    with open(schema_file, "r", encoding="utf-8") as f:
+        schema: dict = json.load(f)
+    return schema
+
+
 def _validation_errors(config: Union[dict, list], schema: dict) -> List[str]:
     """
     Identify schema-validation errors.
@@ -83,12 +106,19 @@ def _validation_errors(config: Union[dict, list], schema: dict) -> List[str]:
     :return: Any validation errors.
     """
 
+    # Defer the jsonschema/referencing imports, which dominate this module's import time, so that
+    # they are paid only when validation actually runs.
+
+    import jsonschema  # pylint: disable=import-outside-toplevel
+    from referencing import Registry, Resource  # pylint: disable=import-outside-toplevel
+    from referencing.jsonschema import DRAFT202012  # pylint: disable=import-outside-toplevel
+
     # See https://github.com/python-jsonschema/referencing/issues/61 about typing issues.
 
     def retrieve(uri: str) -> Resource:
         name = uri.split(":")[-1]
-        with open(resource_path(f"jsonschema/{name}.jsonschema"), "r", encoding="utf-8") as f:
-            return Resource(contents=json.load(f), specification=DRAFT202012)  # type: ignore
+        contents = _schema(resource_path(f"jsonschema/{name}.jsonschema"))
+        return Resource(contents=contents, specification=DRAFT202012)  # type: ignore
 
     registry = Registry(retrieve=retrieve)  # type: ignore
     validator = jsonschema.Draft202012Validator(schema, registry=registry)
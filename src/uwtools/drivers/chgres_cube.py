@@ -3,6 +3,7 @@ A driver for chgres_cube.
 """
 
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional
 
@@ -13,6 +14,9 @@ from uwtools.drivers.driver import Driver
 from uwtools.strings import STR
 from uwtools.utils.tasks import file
 
+_GRID_FILES = itemgetter("mosaic_file_target_grid", "varmap_file", "vcoord_file_target_grid")
+_INPUT_FILES = itemgetter("atm_files_input_grid", "grib2_file_input_grid", "sfc_files_input_grid")
+
 
 class ChgresCube(Driver):
     """
@@ -51,12 +55,9 @@ class ChgresCube(Driver):
         path = self._rundir / fn
         yield asset(path, path.is_file)
         config_files = self._driver_config["namelist"]["update_values"]["config"]
-        input_paths = [
-            Path(config_files[k])
-            for k in ("mosaic_file_target_grid", "varmap_file", "vcoord_file_target_grid")
-        ] + [
-            Path(config_files["data_dir_input_grid"]) / config_files[k]
-            for k in ("atm_files_input_grid", "grib2_file_input_grid", "sfc_files_input_grid")
+        data_dir = Path(config_files["data_dir_input_grid"])
+        input_paths = [Path(p) for p in _GRID_FILES(config_files)] + [
+            data_dir / p for p in _INPUT_FILES(config_files)
         ]
         yield [file(input_path) for input_path in input_paths]
         self._create_user_updated_config(
@@ -6,12 +6,14 @@ import re
 import stat
 from abc import ABC, abstractmethod
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 from textwrap import dedent
 from typing import Any, Dict, List, Optional, Type
 
 from iotaa import asset, task, tasks
 
+from uwtools.config.cache import load_yaml
 from uwtools.config.formats.base import Config
 from uwtools.config.formats.yaml import YAMLConfig
 from uwtools.config.validator import validate_internal
@@ -41,7 +43,7 @@ class Driver(ABC):
         :param batch: Run component via the batch system?
         :param cycle: The cycle.
         """
-        self._config = YAMLConfig(config=config)
+        self._config = YAMLConfig(config=load_yaml(config) if config else None)
         self._dry_run = dry_run
         self._batch = batch
         self._config.dereference()
@@ -114,7 +116,7 @@ class Driver(ABC):
             config_class.dump_dict(cfg=user_values, path=path)
         log.debug(f"Wrote config to {path}")
 
-    @property
+    @cached_property
     def _driver_config(self) -> Dict[str, Any]:
         """
         Returns the config block specific to this driver.
@@ -157,7 +159,7 @@ class Driver(ABC):
             **self._driver_config.get("execution", {}).get("batchargs", {}),
         }
 
-    @property
+    @cached_property
     def _runcmd(self) -> str:
         """
         Returns the full command-line component invocation.
@@ -221,7 +223,7 @@ class Driver(ABC):
         """
         return self._rundir / f"runscript.{self._driver_name}"
 
-    @property
+    @cached_property
     def _scheduler(self) -> JobScheduler:
         """
         Returns the job scheduler specified by the platform information.
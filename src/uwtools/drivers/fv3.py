@@ -3,6 +3,8 @@ A driver for the FV3 model.
 """
 
 from datetime import datetime
+from functools import cached_property
+from itertools import product
 from pathlib import Path
 from shutil import copy
 from typing import Optional
@@ -51,18 +53,17 @@ class FV3(Driver):
         Lateral boundary-condition files.
         """
         yield self._taskname("lateral boundary-condition files")
-        lbcs = self._driver_config["lateral_boundary_conditions"]
-        offset = abs(lbcs["offset"])
-        endhour = self._driver_config["length"] + offset + 1
-        interval = lbcs["interval_hours"]
-        symlinks = {}
-        for n in [7] if self._driver_config["domain"] == "global" else range(1, 7):
-            for boundary_hour in range(offset, endhour, interval):
-                target = Path(lbcs["path"].format(tile=n, forecast_hour=boundary_hour))
-                linkname = (
-                    self._rundir / "INPUT" / f"gfs_bndy.tile{n}.{(boundary_hour - offset):03d}.nc"
-                )
-                symlinks[target] = linkname
+        driver_config = self._driver_config
+        target = driver_config["lateral_boundary_conditions"]["path"].format
+        input_dir = self._rundir / "INPUT"
+        tiles = [7] if driver_config["domain"] == "global" else range(1, 7)
+        hours = self._boundary_hours
+        offset = hours.start
+        symlinks = {
+            Path(target(tile=n, forecast_hour=boundary_hour)): input_dir
+            / f"gfs_bndy.tile{n}.{(boundary_hour - offset):03d}.nc"
+            for n, boundary_hour in product(tiles, hours)
+        }
         yield [symlink(target=t, linkname=l) for t, l in symlinks.items()]
 
     @task
@@ -200,6 +201,16 @@ class FV3(Driver):
 
     # Private helper methods
 
+    @cached_property
+    def _boundary_hours(self) -> range:
+        """
+        Returns the offset-adjusted hours at which lateral boundary-condition files are expected.
+        """
+        lbcs = self._driver_config["lateral_boundary_conditions"]
+        offset = abs(lbcs["offset"])
+        endhour = self._driver_config["length"] + offset + 1
+        return range(offset, endhour, lbcs["interval_hours"])
+
     @property
     def _driver_name(self) -> str:
         """
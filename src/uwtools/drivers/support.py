@@ -1,3 +1,4 @@
+from functools import cache
 from typing import Dict
 
 import iotaa as _iotaa
@@ -12,6 +13,7 @@ def graph() -> str:
     return _iotaa.graph()
 
 
+@cache
 def tasks(driver_class: type[Driver]) -> Dict[str, str]:
     """
     Returns a mapping from task names to their one-line descriptions.
@@ -90,7 +90,6 @@ class Ungrib(Driver):
         yield self._taskname(str(path))
         yield asset(path, path.is_file)
         yield None
-        path.parent.mkdir(parents=True, exist_ok=True)
         self._create_user_updated_config(
             config_class=NMLConfig,
             config_values=d,
@@ -132,7 +131,7 @@ class Ungrib(Driver):
         infile = Path(self._driver_config["vtable"])
         yield file(path=infile)
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.symlink_to(Path(self._driver_config["vtable"]))
+        path.symlink_to(infile)
 
     # Private helper methods
 
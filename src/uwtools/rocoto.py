@@ -206,11 +206,11 @@ class _RocotoXML:
         :param tag: Name of new element to add.
         """
         tag, name = self._tag_name(tag)
-        if tag in (STR.and_, STR.nand, STR.nor, STR.not_, STR.or_, STR.xor):
+        if tag in _BOOLEAN_TAGS:
             e = SubElement(e, tag)
             for subtag, subconfig in config.items():
                 self._add_task_dependency_child(e, subconfig, subtag)
-        elif tag in (STR.streq, STR.strneq):
+        elif tag in _STREQUALITY_TAGS:
             self._add_task_dependency_strequality(e, config, tag)
         elif tag == STR.sh:
             self._add_task_dependency_sh(e, config, name)
@@ -461,3 +461,7 @@ class STR:
     walltime: str = "walltime"
     workflow: str = "workflow"
     xor: str = "xor"
+
+
+_BOOLEAN_TAGS = frozenset({STR.and_, STR.nand, STR.nor, STR.not_, STR.or_, STR.xor})
+_STREQUALITY_TAGS = frozenset({STR.streq, STR.strneq})
@@ -73,10 +73,12 @@ class JobScheduler(ABC):
         :param submit_file: Path to file to write output of submit command to.
         :return: Did the run exit with a success status?
         """
-        cmd = f"{self._submit_cmd} {runscript}"
+        success, output = execute(
+            cmd=[self._submit_cmd, str(runscript)], cwd=f"{runscript.parent}", log_output=True
+        )
         if submit_file:
-            cmd += " 2>&1 | tee %s" % submit_file
-        success, _ = execute(cmd=cmd, cwd=f"{runscript.parent}")
+            with open(submit_file, "w", encoding="utf-8") as f:
+                f.write(output)
         return success
 
     # Private methods
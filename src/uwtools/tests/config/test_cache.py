@@ -0,0 +1,133 @@
+# pylint: disable=missing-function-docstring,no-value-for-parameter,protected-access,redefined-outer-name
+"""
+Tests for uwtools.config.cache module.
+"""
+
+import json
+import os
+from unittest.mock import patch
+
+import yaml
+from pytest import fixture
+
+from uwtools.config import cache
+
+# Fixtures
+
+
+@fixture
+def config_file(tmp_path):
+    path = tmp_path / "config.yaml"
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.dump({"fruit": "papaya"}, f)
+    return path
+
+
+@fixture(autouse=True)
+def reset_cache():
+    cache._parse_yaml.cache_clear()
+
+
+# Tests
+
+
+def test_load_yaml(config_file):
+    assert cache.load_yaml(config_file) == {"fruit": "papaya"}
+
+
+def test_load_yaml_cache_hit(config_file):
+    d1 = cache.load_yaml(config_file)
+    d2 = cache.load_yaml(config_file)
+    info = cache._parse_yaml.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+    assert d1 == d2
+    assert d1 is not d2
+
+
+def test_load_yaml_cache_invalidation(config_file):
+    assert cache.load_yaml(config_file) == {"fruit": "papaya"}
+    with open(config_file, "w", encoding="utf-8") as f:
+        yaml.dump({"fruit": "dragonfruit"}, f)
+    assert cache.load_yaml(config_file) == {"fruit": "dragonfruit"}
+
+
+def test_load_yaml_isolation(config_file):
+    d1 = cache.load_yaml(config_file)
+    d1["fruit"] = "starfruit"
+    assert cache.load_yaml(config_file) == {"fruit": "papaya"}
+
+
+def test_load_yaml_include_bypasses_cache(tmp_path):
+    common = tmp_path / "common.yaml"
+    with open(common, "w", encoding="utf-8") as f:
+        yaml.dump({"fruit": "papaya"}, f)
+    top = tmp_path / "top.yaml"
+    with open(top, "w", encoding="utf-8") as f:
+        print("top: !INCLUDE [common.yaml]", file=f)
+    assert cache.load_yaml(top) == {"top": {"fruit": "papaya"}}
+    with open(common, "w", encoding="utf-8") as f:
+        yaml.dump({"fruit": "dragonfruit"}, f)
+    assert cache.load_yaml(top) == {"top": {"fruit": "dragonfruit"}}
+    assert not (tmp_path / "top.yaml.json").is_file()
+    info = cache._parse_yaml.cache_info()
+    assert info.hits == 0
+    assert info.misses == 0
+
+
+def test_load_yaml_sidecar_written(config_file):
+    cache.load_yaml(config_file)
+    sidecar = config_file.parent / "config.yaml.json"
+    with open(sidecar, "r", encoding="utf-8") as f:
+        assert json.load(f) == {"fruit": "papaya"}
+
+
+def test_load_yaml_sidecar_skipped_for_unsafe_content(config_file):
+    with open(config_file, "w", encoding="utf-8") as f:
+        yaml.dump({1: "papaya"}, f)
+    assert cache.load_yaml(config_file) == {1: "papaya"}
+    assert not (config_file.parent / "config.yaml.json").is_file()
+
+
+def test_load_yaml_sidecar_used(config_file):
+    sidecar = config_file.parent / "config.yaml.json"
+    with open(sidecar, "w", encoding="utf-8") as f:
+        json.dump({"fruit": "mango"}, f)
+    assert cache.load_yaml(config_file) == {"fruit": "mango"}
+
+
+def test_load_yaml_sidecar_stale(config_file):
+    sidecar = config_file.parent / "config.yaml.json"
+    with open(sidecar, "w", encoding="utf-8") as f:
+        json.dump({"fruit": "mango"}, f)
+    mtime = config_file.stat().st_mtime_ns
+    os.utime(sidecar, ns=(mtime - 1, mtime - 1))
+    assert cache.load_yaml(config_file) == {"fruit": "papaya"}
+
+
+def test_load_yaml_sidecar_unparseable(config_file):
+    sidecar = config_file.parent / "config.yaml.json"
+    with open(sidecar, "w", encoding="utf-8") as f:
+        print("{", file=f)
+    assert cache.load_yaml(config_file) == {"fruit": "papaya"}
+
+
+def test_load_yaml_sidecar_unwritable(config_file):
+    with patch.object(cache.os, "replace", side_effect=OSError):
+        assert cache.load_yaml(config_file) == {"fruit": "papaya"}
+    assert not (config_file.parent / "config.yaml.json").is_file()
+
+
+def test__json_safe():
+    assert cache._json_safe({"a": [1, 2.5, True, None, "b"]})
+    assert not cache._json_safe({1: "a"})
+    assert not cache._json_safe({"a": [{1: "a"}]})
+    assert not cache._json_safe({"a": object()})
+
+
+def test_hit_rate(config_file):
+    assert cache.hit_rate() == 0.0
+    cache.load_yaml(config_file)
+    assert cache.hit_rate() == 0.0
+    cache.load_yaml(config_file)
+    assert cache.hit_rate() == 0.5
@@ -181,6 +181,14 @@ def test__prep_config_file(prep_config_dict, tmp_path):
     assert cfgobj == {"roses": "red", "color": "red"}
 
 
+def test__schema_reload_on_update(schema, schema_file):
+    assert validator._schema(schema_file)["properties"]["number"] == {"type": "number"}
+    schema["properties"]["number"] = {"type": "string"}
+    with open(schema_file, "w", encoding="utf-8") as f:
+        json.dump(schema, f, indent=2)
+    assert validator._schema(schema_file)["properties"]["number"] == {"type": "string"}
+
+
 def test__validation_errors_bad_enum_value(config, schema):
     config["color"] = "yellow"
     assert len(validator._validation_errors(config, schema)) == 1
@@ -230,6 +230,10 @@ def test_FV3__run_via_local_execution(driverobj):
         prd.assert_called_once_with()
 
 
+def test_FV3__boundary_hours(driverobj):
+    assert driverobj._boundary_hours == range(0, 2, 1)
+
+
 def test_FV3__driver_config(driverobj):
     assert driverobj._driver_config == driverobj._config["fv3"]
 
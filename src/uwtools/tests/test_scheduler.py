@@ -94,11 +94,13 @@ def test_JobScheduler_submit_job(schedulerobj, tmp_path):
     runscript = tmp_path / "runscript"
     submit_file = tmp_path / "runscript.submit"
     with patch.object(scheduler, "execute") as execute:
-        execute.return_value = (True, None)
+        execute.return_value = (True, "submitted")
         assert schedulerobj.submit_job(runscript=runscript, submit_file=submit_file) is True
         execute.assert_called_once_with(
-            cmd=f"sub {runscript} 2>&1 | tee {submit_file}", cwd=str(tmp_path)
+            cmd=["sub", str(runscript)], cwd=str(tmp_path), log_output=True
         )
+        with open(submit_file, "r", encoding="utf-8") as f:
+            assert f.read() == "submitted"
 
 
 def test_JobScheduler__directive_separator(schedulerobj):
@@ -21,6 +21,23 @@ def test_run_failure(caplog):
     assert logged(caplog, "    expr: division by zero")
 
 
+def test_run_failure_missing_executable(caplog):
+    processing.log.setLevel(logging.INFO)
+    success, output = processing.execute(cmd=["uw-no-such-cmd", "foo"])
+    assert success is False
+    assert "No such file or directory" in output
+    assert logged(caplog, "Executing: uw-no-such-cmd foo")
+    assert logged(caplog, "  Failed: [Errno 2] No such file or directory: 'uw-no-such-cmd'")
+
+
+def test_run_success_argv(caplog):
+    processing.log.setLevel(logging.INFO)
+    success, _ = processing.execute(cmd=["echo", "hello"], log_output=True)
+    assert success
+    assert logged(caplog, "Executing: echo hello")
+    assert logged(caplog, "    hello")
+
+
 def test_run_success(caplog, tmp_path):
     processing.log.setLevel(logging.INFO)
     cmd = "echo hello $FOO"
@@ -31,6 +31,15 @@ def test_tasks_filecopy(tmp_path):
     assert dst.is_file()
 
 
+def test_tasks_filecopy_deep_dst(tmp_path):
+    src = tmp_path / "src"
+    dst = tmp_path / "a" / "b" / "dst"
+    src.touch()
+    assert not dst.is_file()
+    tasks.filecopy(src=src, dst=dst)
+    assert dst.is_file()
+
+
 def test_tasks_symlink(tmp_path):
     target = tmp_path / "target"
     link = tmp_path / "link"
@@ -91,10 +91,14 @@ def readable(
         yield _stdinproxy()
 
 
+@cache
 def resource_path(suffix: str = "") -> Path:
     """
     Returns a pathlib Path object to a uwtools resource file.
 
+    The resolved path is fixed for the life of the process, so each unique suffix is resolved via
+    importlib.resources only once.
+
     :param suffix: A subpath relative to the location of the uwtools resource files. The prefix path
         to the resources files is known to Python and varies based on installation location.
     """
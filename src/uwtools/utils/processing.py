@@ -4,21 +4,24 @@ Utilities for interacting with external processes.
 
 from pathlib import Path
 from subprocess import STDOUT, CalledProcessError, check_output
-from typing import Dict, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from uwtools.logging import log
 
 
 def execute(
-    cmd: str,
+    cmd: Union[List[str], str],
     cwd: Optional[Union[Path, str]] = None,
     env: Optional[Dict[str, str]] = None,
     log_output: Optional[bool] = False,
 ) -> Tuple[bool, str]:
     """
-    Execute a command in a subshell.
+    Execute a command.
 
-    :param cmd: The command to execute.
+    A string command is executed in a subshell; an argv-list command is executed directly, avoiding
+    the fork/exec and parsing cost of an intermediate shell.
+
+    :param cmd: The command to execute, as a shell command string or an argv list.
     :param cwd: Change to this directory before executing cmd.
     :param env: Environment variables to set before executing cmd.
     :param log_output: Log output from successful cmd? (Error output is always logged.)
@@ -26,7 +29,7 @@ def execute(
     """
 
     indent = "  "
-    log.info("Executing: %s", cmd)
+    log.info("Executing: %s", cmd if isinstance(cmd, str) else " ".join(cmd))
     if cwd:
         log.info("%sin %s", indent, cwd)
     if env:
@@ -35,7 +38,13 @@ def execute(
             log.info("%s%s=%s", indent * 2, key, val)
     try:
         output = check_output(
-            cmd, cwd=cwd, encoding="utf=8", env=env, shell=True, stderr=STDOUT, text=True
+            cmd,
+            cwd=cwd,
+            encoding="utf=8",
+            env=env,
+            shell=isinstance(cmd, str),
+            stderr=STDOUT,
+            text=True,
         )
         logfunc = log.info
         success = True
@@ -44,6 +53,11 @@ def execute(
         log.error("%sFailed with status: %s", indent, e.returncode)
         logfunc = log.error
         success = False
+    except OSError as e:
+        output = str(e)
+        log.error("%sFailed: %s", indent, e)
+        logfunc = log.error
+        success = False
     if output and (log_output or not success):
         logfunc("%sOutput:", indent)
         for line in output.split("\n"):
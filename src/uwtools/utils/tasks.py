@@ -31,7 +31,7 @@ def filecopy(src: Path, dst: Path):
     yield "Copy %s -> %s" % (src, dst)
     yield asset(dst, dst.is_file)
     yield file(src)
-    dst.parent.mkdir(exist_ok=True)
+    _mkdir(dst.parent)
     copy(src, dst)
 
 
@@ -46,5 +46,15 @@ def symlink(target: Path, linkname: Path):
     yield "Link %s -> %s" % (linkname, target)
     yield asset(linkname, linkname.exists)
     yield file(target)
-    linkname.parent.mkdir(parents=True, exist_ok=True)
+    _mkdir(linkname.parent)
     os.symlink(src=target, dst=linkname)
+
+
+def _mkdir(path: Path) -> Path:
+    """
+    Creates a directory, including any missing intermediate directories.
+
+    :param path: Path to the directory to create.
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    return path